@@ -0,0 +1,70 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+def _generation_key(inn):
+    return f'org:balance_generation:{inn}'
+
+
+def _key(inn, generation):
+    return f'org:balance_kopecks:{inn}:{generation}'
+
+
+def get_generation(inn):
+    """
+    Возвращает текущее поколение кэша баланса организации.
+
+    Поколение увеличивается при каждом изменении баланса, поэтому значение,
+    прочитанное из базы до изменения, попадает под старый ключ и больше не
+    читается. Должно читаться до SELECT баланса из базы. При ошибке кэша
+    возвращает None: баланс тогда не кэшируется.
+    """
+    try:
+        return cache.get(_generation_key(inn), 0)
+    except Exception as e:
+        logger.warning('Balance cache read failed for %s: %s', inn, e)
+        return None
+
+
+def get_balance(inn, generation):
+    """
+    Возвращает закэшированный баланс организации в копейках или None.
+
+    Ошибка кэша считается промахом: баланс будет прочитан из базы.
+    """
+    if generation is None:
+        return None
+    try:
+        return cache.get(_key(inn, generation))
+    except Exception as e:
+        logger.warning('Balance cache read failed for %s: %s', inn, e)
+        return None
+
+
+def add_balance(inn, generation, balance_kopecks):
+    """Кладет прочитанный из базы баланс в кэш под ключом поколения."""
+    if generation is None:
+        return
+    try:
+        cache.add(
+            _key(inn, generation), balance_kopecks,
+            timeout=settings.BALANCE_CACHE_TIMEOUT
+        )
+    except Exception as e:
+        logger.warning('Balance cache write failed for %s: %s', inn, e)
+
+
+def invalidate_balances(inns):
+    """Сбрасывает кэш балансов организаций, увеличивая их поколение."""
+    for inn in inns:
+        key = _generation_key(inn)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Ключа поколения еще нет: создаем его, если не успел другой процесс.
+            if not cache.add(key, 1, timeout=None):
+                cache.incr(key)
@@ -0,0 +1,134 @@
+import logging
+import socket
+import time
+
+import msgspec
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, transaction
+
+from api.schemas import decode_webhook
+from api.services import process_payments
+from api.webhook_queue import (
+    ack_webhooks,
+    claim_webhooks,
+    ensure_group,
+    read_webhooks,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Обрабатывает webhook-и из очереди Redis пачками'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--consumer',
+            default=socket.gethostname(),
+            help='Имя потребителя в группе Redis Stream'
+        )
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=1000,
+            help='Максимальный размер пачки'
+        )
+        parser.add_argument(
+            '--block',
+            type=int,
+            default=100,
+            help='Время ожидания новых записей в миллисекундах'
+        )
+        parser.add_argument(
+            '--claim-idle',
+            type=int,
+            default=30000,
+            help='Через сколько миллисекунд без подтверждения запись '
+                 'забирается для повторной обработки'
+        )
+        parser.add_argument(
+            '--claim-interval',
+            type=float,
+            default=10,
+            help='Интервал проверки неподтвержденных записей в секундах'
+        )
+        parser.add_argument(
+            '--max-backoff',
+            type=float,
+            default=30,
+            help='Максимальная пауза после неудачной пачки в секундах'
+        )
+
+    def handle(self, *args, **options):
+        consumer = options['consumer']
+        count = options['count']
+        ensure_group()
+
+        claim_start = '0-0'
+        next_claim_at = 0.0
+        failures = 0
+        while True:
+            # В management-команде нет сигналов запроса, поэтому устаревшие
+            # и разорванные соединения с БД закрываем сами.
+            close_old_connections()
+
+            claimed = time.monotonic() >= next_claim_at
+            if claimed:
+                claim_start, entries = claim_webhooks(
+                    consumer, count, options['claim_idle'], claim_start)
+                if claim_start == '0-0':
+                    next_claim_at = time.monotonic() + options['claim_interval']
+            else:
+                entries = read_webhooks(consumer, count, options['block'])
+
+            if not entries:
+                continue
+
+            if self._process_entries(entries, one_by_one=claimed):
+                failures = 0
+            else:
+                failures += 1
+                close_old_connections()
+                time.sleep(min(2 ** (failures - 1), options['max_backoff']))
+
+    def _process_entries(self, entries, one_by_one=False):
+        """
+        Обрабатывает пачку записей очереди одной транзакцией.
+
+        Записи подтверждаются только после коммита. При ошибке они остаются
+        в списке ожидающих и через --claim-idle миллисекунд повторно
+        забираются через XAUTOCLAIM. Повторную пачку при ошибке обрабатываем
+        по одной записи, чтобы одна проблемная запись не держала остальные.
+
+        Returns:
+            bool: True, если все записи обработаны и подтверждены
+        """
+        if self._process_batch(entries):
+            return True
+        if not one_by_one or len(entries) == 1:
+            return False
+
+        processed = True
+        for entry in entries:
+            close_old_connections()
+            processed = self._process_batch([entry]) and processed
+        return processed
+
+    def _process_batch(self, entries):
+        """Обрабатывает записи одной транзакцией и подтверждает их."""
+        webhooks = []
+        for entry_id, payload in entries:
+            try:
+                webhooks.append(decode_webhook(payload))
+            except msgspec.DecodeError as e:
+                logger.error('Invalid webhook %s in queue: %s', entry_id, e)
+
+        try:
+            with transaction.atomic():
+                process_payments(webhooks)
+        except Exception as e:
+            logger.error('Error processing queued webhooks: %s', e, exc_info=True)
+            return False
+
+        ack_webhooks([entry_id for entry_id, _ in entries])
+        return True
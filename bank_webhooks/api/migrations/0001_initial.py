@@ -0,0 +1,60 @@
+# Generated by Django 4.2.17 on 2026-10-14 13:09
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Organization',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('inn', models.CharField(db_index=True, help_text='ИНН организации (10 или 12 цифр)', max_length=12, unique=True, verbose_name='ИНН организации')),
+                ('balance', models.DecimalField(decimal_places=2, default=0, help_text='Текущий баланс организации в рублях', max_digits=15, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Баланс')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Дата создания')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата обновления')),
+            ],
+            options={
+                'verbose_name': 'Организация',
+                'verbose_name_plural': 'Организации',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Payment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('operation_id', models.UUIDField(db_index=True, help_text='Уникальный идентификатор операции', unique=True, verbose_name='ID операции')),
+                ('amount', models.DecimalField(decimal_places=2, help_text='Сумма в рублях', max_digits=15, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Сумма платежа')),
+                ('payer_inn', models.CharField(db_index=True, help_text='ИНН организации-плательщика', max_length=12, verbose_name='ИНН плательщика')),
+                ('document_number', models.CharField(db_index=True, help_text='Номер платежного документа', max_length=100, verbose_name='Номер документа')),
+                ('document_date', models.DateTimeField(help_text='Дата создания документа', verbose_name='Дата документа')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Дата создания записи')),
+            ],
+            options={
+                'verbose_name': 'Платеж',
+                'verbose_name_plural': 'Платежи',
+                'ordering': ['-document_date', '-created_at'],
+                'indexes': [models.Index(fields=['operation_id'], name='api_payment_operati_f52926_idx'), models.Index(fields=['payer_inn'], name='api_payment_payer_i_05435e_idx'), models.Index(fields=['document_number'], name='api_payment_documen_2355f3_idx'), models.Index(fields=['document_date'], name='api_payment_documen_c51bd8_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='payment',
+            constraint=models.CheckConstraint(check=models.Q(('amount__gte', 0)), name='payment_amount_non_negative'),
+        ),
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(fields=['inn'], name='api_organiz_inn_ebc9f5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(fields=['balance'], name='api_organiz_balance_e3a758_idx'),
+        ),
+    ]
@@ -0,0 +1,90 @@
+from decimal import Decimal
+
+import django.core.validators
+from django.db import migrations, models
+from django.db.models import ExpressionWrapper, F, Value
+from django.db.models.functions import Cast
+
+KOPECKS_IN_RUBLE = 100
+
+
+def rubles_to_kopecks(apps, schema_editor):
+    """Переносит суммы из рублевых DecimalField в копейки (x100)."""
+    Organization = apps.get_model('api', 'Organization')
+    Payment = apps.get_model('api', 'Payment')
+    Organization.objects.update(balance_kopecks=Cast(
+        F('balance') * KOPECKS_IN_RUBLE, models.BigIntegerField()))
+    Payment.objects.update(amount_kopecks=Cast(
+        F('amount') * KOPECKS_IN_RUBLE, models.BigIntegerField()))
+
+
+def kopecks_to_rubles(apps, schema_editor):
+    """Обратный перенос: копейки в рубли."""
+    Organization = apps.get_model('api', 'Organization')
+    Payment = apps.get_model('api', 'Payment')
+    rubles = models.DecimalField(max_digits=15, decimal_places=2)
+    # Умножение на 0.01, а не деление на 100: целочисленное деление
+    # на некоторых СУБД отбросило бы копейки.
+    kopeck = Value(Decimal('0.01'))
+    Organization.objects.update(balance=ExpressionWrapper(
+        F('balance_kopecks') * kopeck, output_field=rubles))
+    Payment.objects.update(amount=ExpressionWrapper(
+        F('amount_kopecks') * kopeck, output_field=rubles))
+
+
+class Migration(migrations.Migration):
+    """
+    Перевод балансов и сумм платежей из рублей (DecimalField) в копейки
+    (BigIntegerField).
+
+    Новые колонки добавляются рядом со старыми, заполняются значениями x100
+    и только после этого старые колонки удаляются. Индекс на balance
+    удаляется вместе с колонкой и на balance_kopecks не переносится:
+    по балансу никто не фильтрует.
+    """
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='balance_kopecks',
+            field=models.BigIntegerField(default=0, help_text='Текущий баланс организации в копейках', validators=[django.core.validators.MinValueValidator(0)], verbose_name='Баланс'),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='amount_kopecks',
+            field=models.BigIntegerField(default=0, help_text='Сумма в копейках', validators=[django.core.validators.MinValueValidator(0)], verbose_name='Сумма платежа'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(rubles_to_kopecks, kopecks_to_rubles),
+        migrations.RemoveConstraint(
+            model_name='payment',
+            name='payment_amount_non_negative',
+        ),
+        migrations.RemoveIndex(
+            model_name='organization',
+            name='api_organiz_balance_e3a758_idx',
+        ),
+        migrations.RemoveField(
+            model_name='organization',
+            name='balance',
+        ),
+        # Default нужен только для отката: обратная операция RemoveField
+        # заново добавляет amount в таблицу с уже существующими строками.
+        migrations.AlterField(
+            model_name='payment',
+            name='amount',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Сумма в рублях', max_digits=15, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Сумма платежа'),
+        ),
+        migrations.RemoveField(
+            model_name='payment',
+            name='amount',
+        ),
+        migrations.AddConstraint(
+            model_name='payment',
+            constraint=models.CheckConstraint(check=models.Q(('amount_kopecks__gte', 0)), name='payment_amount_non_negative'),
+        ),
+    ]
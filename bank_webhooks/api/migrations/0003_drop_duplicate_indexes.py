@@ -0,0 +1,39 @@
+# Generated by Django 4.2.17 on 2026-10-14 13:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_balance_in_kopecks'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='organization',
+            name='api_organiz_inn_ebc9f5_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='payment',
+            name='api_payment_operati_f52926_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='payment',
+            name='api_payment_payer_i_05435e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='payment',
+            name='api_payment_documen_2355f3_idx',
+        ),
+        migrations.AlterField(
+            model_name='organization',
+            name='inn',
+            field=models.CharField(help_text='ИНН организации (10 или 12 цифр)', max_length=12, unique=True, verbose_name='ИНН организации'),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='operation_id',
+            field=models.UUIDField(help_text='Уникальный идентификатор операции', unique=True, verbose_name='ID операции'),
+        ),
+    ]
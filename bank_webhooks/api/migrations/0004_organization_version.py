@@ -0,0 +1,18 @@
+# Generated by Django 4.2.17 on 2026-10-14 13:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_drop_duplicate_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='version',
+            field=models.PositiveIntegerField(default=0, help_text='Увеличивается при каждом изменении баланса', verbose_name='Версия'),
+        ),
+    ]
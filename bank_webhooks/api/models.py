@@ -1,7 +1,31 @@
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+KOPECKS_IN_RUBLE = 100
+
+
+def to_kopecks(rubles):
+    """Переводит сумму в рублях (Decimal, 2 знака) в целые копейки."""
+    return int(rubles * KOPECKS_IN_RUBLE)
+
+
+def to_rubles(kopecks):
+    """Переводит целые копейки в сумму в рублях (Decimal, 2 знака)."""
+    return Decimal(kopecks).scaleb(-2)
+
+
+def is_digits(value):
+    """
+    Проверяет, что строка состоит только из цифр 0-9.
+
+    В отличие от str.isdigit() не пропускает цифры других алфавитов.
+    """
+    return value.isascii() and value.isdigit()
+
 
 class Organization(models.Model):
     """
@@ -9,24 +33,29 @@ class Organization(models.Model):
 
     Attributes:
         inn (str): ИНН организации (10 или 12 цифр), уникальный
-        balance (Decimal): Текущий баланс организации (не может быть отрицательным)
+        balance_kopecks (int): Текущий баланс организации в копейках
+            (не может быть отрицательным)
+        version (int): Счетчик изменений баланса (для оптимистичных блокировок)
     """
 
     inn = models.CharField(
         max_length=12,
         unique=True,
         verbose_name=_('ИНН организации'),
-        help_text=_('ИНН организации (10 или 12 цифр)'),
-        db_index=True
+        help_text=_('ИНН организации (10 или 12 цифр)')
     )
 
-    balance = models.DecimalField(
-        max_digits=15,
-        decimal_places=2,
+    balance_kopecks = models.BigIntegerField(
         default=0,
         validators=[MinValueValidator(0)],
         verbose_name=_('Баланс'),
-        help_text=_('Текущий баланс организации в рублях')
+        help_text=_('Текущий баланс организации в копейках')
+    )
+
+    version = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Версия'),
+        help_text=_('Увеличивается при каждом изменении баланса')
     )
 
     created_at = models.DateTimeField(
@@ -44,10 +73,11 @@ class Organization(models.Model):
         verbose_name = _('Организация')
         verbose_name_plural = _('Организации')
         ordering = ['-created_at']
-        indexes = [
-            models.Index(fields=['inn']),
-            models.Index(fields=['balance']),
-        ]
+
+    @property
+    def balance(self):
+        """Текущий баланс организации в рублях."""
+        return to_rubles(self.balance_kopecks)
 
     def __str__(self):
         return _('Организация %(inn)s (баланс: %(balance)s)') % {
@@ -58,8 +88,8 @@ class Organization(models.Model):
     def clean(self):
         """Дополнительная валидация модели."""
         super().clean()
-        if not self.inn.isdigit():
-            raise models.ValidationError(
+        if not is_digits(self.inn):
+            raise ValidationError(
                 _('ИНН должен содержать только цифры')
             )
 
@@ -70,7 +100,7 @@ class Payment(models.Model):
 
     Attributes:
         operation_id (UUID): Уникальный идентификатор операции
-        amount (Decimal): Сумма платежа (не может быть отрицательной)
+        amount_kopecks (int): Сумма платежа в копейках (не может быть отрицательной)
         payer_inn (str): ИНН плательщика
         document_number (str): Номер платежного документа
         document_date (datetime): Дата документа
@@ -79,16 +109,13 @@ class Payment(models.Model):
     operation_id = models.UUIDField(
         unique=True,
         verbose_name=_('ID операции'),
-        help_text=_('Уникальный идентификатор операции'),
-        db_index=True
+        help_text=_('Уникальный идентификатор операции')
     )
 
-    amount = models.DecimalField(
-        max_digits=15,
-        decimal_places=2,
+    amount_kopecks = models.BigIntegerField(
         validators=[MinValueValidator(0)],
         verbose_name=_('Сумма платежа'),
-        help_text=_('Сумма в рублях')
+        help_text=_('Сумма в копейках')
     )
 
     payer_inn = models.CharField(
@@ -121,25 +148,27 @@ class Payment(models.Model):
         verbose_name_plural = _('Платежи')
         ordering = ['-document_date', '-created_at']
         indexes = [
-            models.Index(fields=['operation_id']),
-            models.Index(fields=['payer_inn']),
-            models.Index(fields=['document_number']),
             models.Index(fields=['document_date']),
         ]
         constraints = [
             models.CheckConstraint(
-                check=models.Q(amount__gte=0),
+                check=models.Q(amount_kopecks__gte=0),
                 name='payment_amount_non_negative'
             ),
         ]
 
+    @property
+    def amount(self):
+        """Сумма платежа в рублях."""
+        return to_rubles(self.amount_kopecks)
+
     def __str__(self):
         return _(f'Платеж №{self.document_number} на {self.amount} руб. от {self.payer_inn}')
 
     def clean(self):
         """Дополнительная валидация модели."""
         super().clean()
-        if not self.payer_inn.isdigit():
-            raise models.ValidationError(
+        if not is_digits(self.payer_inn):
+            raise ValidationError(
                 _('ИНН плательщика должен содержать только цифры')
             )
@@ -0,0 +1,29 @@
+import hashlib
+import hmac
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import BasePermission
+
+
+class HasWebhookHMAC(BasePermission):
+    """
+    Проверяет HMAC-SHA256 подпись тела запроса в заголовке X-Bank-Signature.
+
+    Подпись - hex-дайджест тела запроса с ключом BANK_WEBHOOK_SECRET.
+    Если ключ не задан, все запросы отклоняются.
+    """
+
+    message = _('Неверная подпись webhook-а')
+
+    def has_permission(self, request, view):
+        secret = settings.BANK_WEBHOOK_SECRET
+        signature = request.headers.get('X-Bank-Signature')
+        if not secret or not signature:
+            return False
+
+        expected = hmac.new(
+            secret.encode(), request.body, hashlib.sha256).hexdigest()
+        # Сравниваем байты: compare_digest на str с не-ASCII символами
+        # (заголовки WSGI декодируются как latin-1) выбрасывает TypeError.
+        return hmac.compare_digest(expected.encode(), signature.encode())
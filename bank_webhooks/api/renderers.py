@@ -0,0 +1,33 @@
+from decimal import Decimal
+
+import orjson
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+
+def _default(obj):
+    """Сериализует типы, которые orjson не поддерживает нативно."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    raise TypeError
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON-рендерер на основе orjson.
+
+    UUID и datetime сериализуются нативно, Decimal - строкой без потери
+    точности, поэтому во view не нужны ручные приведения типов.
+    """
+
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_default)
@@ -0,0 +1,92 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Annotated
+from uuid import UUID
+
+import msgspec
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext as _
+
+from .models import Payment, is_digits, to_kopecks
+
+MAX_AMOUNT = Decimal(10) ** 13
+AMOUNT_QUANTUM = Decimal('0.01')
+
+
+class Webhook(msgspec.Struct):
+    """
+    Схема входящего webhook-а от банка.
+
+    Типы проверяет msgspec при декодировании JSON, остальное - __post_init__
+    с теми же правилами, что были у DRF-сериализатора:
+    - operation_id: уникальный идентификатор операции (UUID)
+    - amount: сумма платежа в рублях (неотрицательная, до 15 цифр, 2 знака)
+    - payer_inn: ИНН плательщика (10-12 цифр, пробелы по краям обрезаются)
+    - document_number: номер платежного документа (непустой, пробелы
+      по краям обрезаются)
+    - document_date: дата и время документа в ISO 8601 (допускается
+      только дата, время без зоны считается UTC)
+    """
+
+    operation_id: UUID
+    amount: Decimal
+    payer_inn: str
+    document_number: Annotated[str, msgspec.Meta(min_length=1)]
+    # Разбирается в datetime в __post_init__, как в DRF DateTimeField:
+    # msgspec принимает только полный RFC 3339.
+    document_date: str
+
+    def __post_init__(self):
+        """Дополнительная валидация и нормализация полей."""
+        if not self.amount.is_finite() or self.amount < 0:
+            raise ValueError(_('Сумма платежа должна быть неотрицательным числом'))
+        if self.amount >= MAX_AMOUNT or self.amount != self.amount.quantize(AMOUNT_QUANTUM):
+            raise ValueError(_('Сумма платежа: не более 15 цифр, из них 2 после запятой'))
+
+        self.payer_inn = self.payer_inn.strip()
+        if not 10 <= len(self.payer_inn) <= 12:
+            raise ValueError(_('ИНН должен содержать от 10 до 12 цифр'))
+        if not is_digits(self.payer_inn):
+            raise ValueError(_('ИНН должен содержать только цифры'))
+
+        self.document_number = self.document_number.strip()
+        if not self.document_number:
+            raise ValueError(_('Номер документа не может быть пустым'))
+        if len(self.document_number) > 100:
+            raise ValueError(_('Номер документа: не более 100 символов'))
+
+        self.document_date = _parse_document_date(self.document_date)
+
+    @property
+    def amount_kopecks(self):
+        """Сумма платежа в копейках."""
+        return to_kopecks(self.amount)
+
+    def to_payment(self):
+        """Создает (несохраненный) платеж по данным webhook-а."""
+        return Payment(
+            operation_id=self.operation_id,
+            amount_kopecks=self.amount_kopecks,
+            payer_inn=self.payer_inn,
+            document_number=self.document_number,
+            document_date=self.document_date
+        )
+
+
+def _parse_document_date(value):
+    """Разбирает дату документа и приводит ее к aware datetime."""
+    if not isinstance(value, datetime):
+        try:
+            value = parse_datetime(value)
+        except ValueError:
+            value = None
+        if value is None:
+            raise ValueError(_('Неверный формат даты документа'))
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+decode_webhook = msgspec.json.Decoder(Webhook).decode
+decode_webhooks = msgspec.json.Decoder(list[Webhook]).decode
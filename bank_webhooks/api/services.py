@@ -0,0 +1,103 @@
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .balance_cache import invalidate_balances
+from .models import Organization, Payment
+
+logger = logging.getLogger(__name__)
+
+
+def process_payments(webhooks):
+    """
+    Пакетно обрабатывает провалидированные webhook-и.
+
+    Отбрасывает дубликаты (по operation_id), создает платежи через
+    bulk_create и начисляет суммарные платежи организаций одним upsert-запросом
+    на пачку. Должна вызываться внутри транзакции.
+
+    Returns:
+        tuple: (количество созданных платежей, количество дубликатов)
+    """
+    unique_webhooks = {}
+    for webhook in webhooks:
+        unique_webhooks.setdefault(webhook.operation_id, webhook)
+
+    existing_ids = _get_existing_operation_ids(list(unique_webhooks))
+    new_payments = [
+        webhook.to_payment()
+        for operation_id, webhook in unique_webhooks.items()
+        if operation_id not in existing_ids
+    ]
+
+    Payment.objects.bulk_create(
+        new_payments,
+        batch_size=settings.BULK_BATCH_SIZE
+    )
+
+    totals = defaultdict(int)
+    for payment in new_payments:
+        totals[payment.payer_inn] += payment.amount_kopecks
+
+    credit_organizations(totals)
+    transaction.on_commit(lambda: invalidate_balances(list(totals)), robust=True)
+
+    duplicates = len(webhooks) - len(new_payments)
+    logger.info(
+        'Payment batch processed. Created: %s, Duplicates: %s, Organizations: %s',
+        len(new_payments), duplicates, len(totals)
+    )
+    return len(new_payments), duplicates
+
+
+def credit_organizations(totals):
+    """
+    Начисляет суммы (в копейках) на балансы организаций по ИНН.
+
+    Выполняет один многострочный INSERT ... ON DUPLICATE KEY UPDATE на
+    пачку: недостающие организации создаются, к балансам существующих
+    сумма атомарно прибавляется. ИНН обрабатываются в отсортированном
+    порядке, чтобы параллельные транзакции блокировали строки в одном
+    порядке и не попадали во взаимоблокировку.
+
+    Args:
+        totals: словарь {ИНН: сумма в копейках}
+    """
+    table = connection.ops.quote_name(Organization._meta.db_table)
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    rows = sorted(totals.items())
+    batch_size = settings.BULK_BATCH_SIZE
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            placeholders = ', '.join(['(%s, %s, 0, %s, %s)'] * len(batch))
+            params = []
+            for inn, amount_kopecks in batch:
+                params.extend([inn, amount_kopecks, now, now])
+            cursor.execute(
+                f'INSERT INTO {table} '
+                '(inn, balance_kopecks, version, created_at, updated_at) '
+                f'VALUES {placeholders} AS new '
+                'ON DUPLICATE KEY UPDATE '
+                f'balance_kopecks = {table}.balance_kopecks + new.balance_kopecks, '
+                f'version = {table}.version + 1, '
+                'updated_at = new.updated_at',
+                params
+            )
+
+
+def _get_existing_operation_ids(operation_ids):
+    """Возвращает operation_id, уже сохраненные в базе."""
+    batch_size = settings.BULK_BATCH_SIZE
+    existing_ids = set()
+    for start in range(0, len(operation_ids), batch_size):
+        existing_ids.update(
+            Payment.objects.filter(
+                operation_id__in=operation_ids[start:start + batch_size]
+            ).values_list('operation_id', flat=True)
+        )
+    return existing_ids
@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .balance_cache import invalidate_balances
+from .models import Organization
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+def invalidate_organization_balance(sender, instance, **kwargs):
+    """Сбрасывает кэш баланса при изменении организации через ORM."""
+    transaction.on_commit(
+        lambda: invalidate_balances([instance.inn]), robust=True)
@@ -1,7 +1,11 @@
 from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
-from .views import BankWebhookView, OrganizationBalanceView
+from .views import (
+    BankWebhookBatchView,
+    BankWebhookView,
+    OrganizationBalanceView,
+)
 
 app_name = 'bank_api'
 
@@ -15,6 +19,15 @@ urlpatterns = [
             'help_text': _('Принимает платежные уведомления и обновляет балансы организаций')
         }
     ),
+    path(
+        'webhook/bank/batch/',
+        BankWebhookBatchView.as_view(),
+        name='bank-webhook-batch',
+        kwargs={
+            'description': _('Эндпоинт для пакетной обработки webhook-ов от банка'),
+            'help_text': _('Принимает список платежных уведомлений за один запрос')
+        }
+    ),
     path(
         'organizations/<str:inn>/balance/',
         OrganizationBalanceView.as_view(),
@@ -1,14 +1,24 @@
 import logging
 
-from django.db import transaction
-from django.shortcuts import get_object_or_404
+import msgspec
+import redis
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.http import Http404
 from rest_framework import status
+from rest_framework.parsers import JSONParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.exceptions import ValidationError
 
-from .models import Organization, Payment
-from .serializers import WebhookSerializer, OrganizationBalanceSerializer
+from .balance_cache import (
+    add_balance, get_balance, get_generation, invalidate_balances)
+from .models import Organization, to_rubles
+from .permissions import HasWebhookHMAC
+from .renderers import ORJSONRenderer
+from .schemas import decode_webhook, decode_webhooks
+from .services import credit_organizations, process_payments
+from .webhook_queue import enqueue_webhooks
 
 logger = logging.getLogger(__name__)
 
@@ -16,94 +26,185 @@ logger = logging.getLogger(__name__)
 class BankWebhookView(APIView):
     """Обработчик входящих webhook-ов от банка."""
 
-    @transaction.atomic
-    def post(self, request):
+    authentication_classes = []
+    permission_classes = [HasWebhookHMAC]
+    renderer_classes = [ORJSONRenderer]
+    parser_classes = [JSONParser]
+
+    def post(self, request, *args, **kwargs):
         """
         Обрабатывает входящий платеж:
         - Валидирует данные
-        - Проверяет на дубликаты
-        - Создает платеж
+        - Создает платеж (дубликаты отсекает уникальный индекс operation_id)
         - Обновляет баланс организации
         """
         try:
-            serializer = WebhookSerializer(data=request.data)
-            serializer.is_valid(raise_exception=True)
-            data = serializer.validated_data
+            webhook = decode_webhook(request.body)
+        except msgspec.DecodeError as e:
+            logger.error('Error processing payment: %s', e)
+            raise ValidationError({"detail": "Payment processing failed"})
 
-            return self._process_payment(data)
+        if settings.WEBHOOK_QUEUE_ENABLED:
+            return self._enqueue_payment(webhook)
 
+        try:
+            with transaction.atomic():
+                return self._process_payment(webhook)
         except Exception as e:
-            logger.error(f"Error processing payment: {str(e)}", exc_info=True)
+            logger.error('Error processing payment: %s', e, exc_info=True)
             raise ValidationError({"detail": "Payment processing failed"})
 
-    def _process_payment(self, payment_data):
-        """Основная логика обработки платежа."""
-        operation_id = payment_data['operation_id']
+    def _enqueue_payment(self, webhook):
+        """
+        Ставит платеж в очередь на асинхронную обработку.
 
-        if Payment.objects.filter(operation_id=operation_id).exists():
-            logger.info(
-                f'Duplicate payment operation: {operation_id}. Skipping.'
+        Недоступность Redis возвращается как 503, чтобы банк повторил
+        отправку, а не счел платеж некорректным.
+        """
+        try:
+            enqueue_webhooks([webhook])
+        except redis.RedisError as e:
+            logger.error(
+                'Error enqueueing payment %s: %s', webhook.operation_id, e,
+                exc_info=True
+            )
+            return Response(
+                {"detail": "Payment queue unavailable"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
             )
+
+        return Response(
+            {'status': 'accepted', 'operation_id': webhook.operation_id},
+            status=status.HTTP_202_ACCEPTED
+        )
+
+    def _process_payment(self, webhook):
+        """Основная логика обработки платежа."""
+        operation_id = webhook.operation_id
+
+        payment = webhook.to_payment()
+        try:
+            with transaction.atomic():
+                payment.save(force_insert=True)
+        except IntegrityError as e:
+            if 'operation_id' not in str(e):
+                raise
+            logger.info('Duplicate payment operation: %s. Skipping.', operation_id)
             return Response(
-                {'status': 'duplicate', 'operation_id': str(operation_id)},
+                {'status': 'duplicate', 'operation_id': operation_id},
                 status=status.HTTP_200_OK
             )
 
-        organization = self._get_or_create_organization(
-            payment_data['payer_inn'])
-        payment = self._create_payment(payment_data)
-        self._update_organization_balance(organization, payment_data['amount'])
+        inn = webhook.payer_inn
+        new_balance_kopecks = self._credit_organization(
+            inn, payment.amount_kopecks)
+        transaction.on_commit(lambda: invalidate_balances([inn]), robust=True)
+        new_balance = to_rubles(new_balance_kopecks)
 
         logger.info(
-            f'Payment processed. Organization: {organization.inn}, '
-            f'Amount: {payment_data["amount"]}, '
-            f'New balance: {organization.balance}, '
-            f'Payment ID: {payment.id}'
+            'Payment processed. Organization: %s, Amount: %s, '
+            'New balance: %s, Payment ID: %s',
+            inn, webhook.amount, new_balance, payment.id
         )
 
         return Response(
             {
                 'status': 'success',
                 'payment_id': payment.id,
-                'organization_inn': organization.inn,
-                'new_balance': float(organization.balance)
+                'organization_inn': inn,
+                'new_balance': new_balance
             },
             status=status.HTTP_201_CREATED
         )
 
-    def _get_or_create_organization(self, inn):
-        """Получает или создает организацию."""
-        organization, created = Organization.objects.get_or_create(
-            inn=inn,
-            defaults={'balance': 0}
-        )
-        if created:
-            logger.debug(f'Created new organization with INN: {inn}')
-        return organization
-
-    def _create_payment(self, payment_data):
-        """Создает запись о платеже."""
-        return Payment.objects.create(
-            operation_id=payment_data['operation_id'],
-            amount=payment_data['amount'],
-            payer_inn=payment_data['payer_inn'],
-            document_number=payment_data['document_number'],
-            document_date=payment_data['document_date']
+    def _credit_organization(self, inn, amount_kopecks):
+        """
+        Начисляет платеж на баланс организации одним upsert-запросом.
+
+        Организация создается при первом платеже. Возвращает новый баланс
+        в копейках.
+        """
+        credit_organizations({inn: amount_kopecks})
+        return Organization.objects.filter(inn=inn).values_list(
+            'balance_kopecks', flat=True).get()
+
+
+class BankWebhookBatchView(APIView):
+    """Пакетный обработчик webhook-ов от банка."""
+
+    authentication_classes = []
+    permission_classes = [HasWebhookHMAC]
+    renderer_classes = [ORJSONRenderer]
+    parser_classes = [JSONParser]
+
+    def post(self, request, *args, **kwargs):
+        """
+        Обрабатывает список входящих платежей одним запросом:
+        - Валидирует все элементы пакета
+        - Отбрасывает дубликаты (по operation_id)
+        - Создает платежи через bulk_create
+        - Обновляет баланс каждой организации одним UPDATE
+        """
+        try:
+            webhooks = decode_webhooks(request.body)
+        except msgspec.DecodeError as e:
+            logger.error('Error processing payment batch: %s', e)
+            raise ValidationError({"detail": "Payment batch processing failed"})
+
+        if settings.WEBHOOK_QUEUE_ENABLED:
+            return self._enqueue_payments(webhooks)
+
+        try:
+            with transaction.atomic():
+                return self._process_payments(webhooks)
+        except Exception as e:
+            logger.error('Error processing payment batch: %s', e, exc_info=True)
+            raise ValidationError({"detail": "Payment batch processing failed"})
+
+    def _enqueue_payments(self, webhooks):
+        """
+        Ставит пакет платежей в очередь на асинхронную обработку.
+
+        Недоступность Redis возвращается как 503, чтобы банк повторил
+        отправку, а не счел пакет некорректным.
+        """
+        try:
+            enqueue_webhooks(webhooks)
+        except redis.RedisError as e:
+            logger.error('Error enqueueing payment batch: %s', e, exc_info=True)
+            return Response(
+                {"detail": "Payment queue unavailable"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        return Response(
+            {'status': 'accepted', 'count': len(webhooks)},
+            status=status.HTTP_202_ACCEPTED
         )
 
-    def _update_organization_balance(self, organization, amount):
-        """Обновляет баланс организации."""
-        organization.balance += amount
-        organization.save()
+    def _process_payments(self, webhooks):
+        """Основная логика пакетной обработки платежей."""
+        created, duplicates = process_payments(webhooks)
+        return Response(
+            {
+                'status': 'success',
+                'created': created,
+                'duplicates': duplicates,
+            },
+            status=status.HTTP_201_CREATED
+        )
 
 
 class OrganizationBalanceView(APIView):
     """API для получения баланса организации."""
 
-    def get(self, request, inn):
+    def get(self, request, inn, **kwargs):
         """
         Возвращает текущий баланс организации по ИНН.
 
+        Баланс читается из кэша, при промахе - одним SELECT из базы
+        с заполнением кэша под поколением, прочитанным до SELECT.
+
         Args:
             inn: ИНН организации (строка, 10 или 12 цифр)
 
@@ -112,13 +213,28 @@ class OrganizationBalanceView(APIView):
             200 с данными баланса при успехе
         """
         try:
-            organization = get_object_or_404(Organization, inn=inn)
-            serializer = OrganizationBalanceSerializer(organization)
-            return Response(serializer.data)
+            generation = get_generation(inn)
+            balance_kopecks = get_balance(inn, generation)
+            if balance_kopecks is None:
+                balance_kopecks = self._fetch_balance(inn)
+                add_balance(inn, generation, balance_kopecks)
+
+            return Response({'inn': inn, 'balance': to_rubles(balance_kopecks)})
 
         except Exception as e:
             logger.error(
-                f"Error fetching balance for organization {inn}: {str(e)}",
-                exc_info=True
+                'Error fetching balance for organization %s: %s', inn, e,
+                exc_info=not isinstance(e, Http404)
             )
             raise
+
+    def _fetch_balance(self, inn):
+        """Читает баланс организации в копейках напрямую из базы."""
+        table = connection.ops.quote_name(Organization._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT balance_kopecks FROM {table} WHERE inn = %s', [inn])
+            row = cursor.fetchone()
+        if row is None:
+            raise Http404
+        return row[0]
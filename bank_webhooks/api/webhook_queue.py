@@ -0,0 +1,116 @@
+import msgspec
+import redis
+from django.conf import settings
+
+_client = None
+
+
+def get_client():
+    """Возвращает общий клиент Redis для очереди webhook-ов."""
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+def enqueue_webhooks(webhooks):
+    """
+    Добавляет провалидированные webhook-и в Redis Stream.
+
+    Args:
+        webhooks: список webhook-ов (api.schemas.Webhook)
+    """
+    pipeline = get_client().pipeline(transaction=False)
+    for webhook in webhooks:
+        pipeline.xadd(
+            settings.WEBHOOK_QUEUE_STREAM,
+            {'payload': msgspec.json.encode(webhook)}
+        )
+    pipeline.execute()
+
+
+def ensure_group():
+    """Создает группу потребителей, если ее еще нет."""
+    try:
+        get_client().xgroup_create(
+            settings.WEBHOOK_QUEUE_STREAM,
+            settings.WEBHOOK_QUEUE_GROUP,
+            id='0',
+            mkstream=True
+        )
+    except redis.ResponseError as e:
+        if 'BUSYGROUP' not in str(e):
+            raise
+
+
+def read_webhooks(consumer, count, block):
+    """
+    Читает пачку новых webhook-ов из очереди для потребителя.
+
+    Args:
+        consumer: имя потребителя в группе
+        count: максимальное количество записей
+        block: время ожидания новых записей в миллисекундах
+
+    Returns:
+        list: пары (id записи, webhook в JSON)
+    """
+    response = get_client().xreadgroup(
+        settings.WEBHOOK_QUEUE_GROUP,
+        consumer,
+        {settings.WEBHOOK_QUEUE_STREAM: '>'},
+        count=count,
+        block=block
+    )
+    if not response:
+        return []
+    _, entries = response[0]
+    return [
+        (entry_id, fields[b'payload'])
+        for entry_id, fields in entries
+    ]
+
+
+def claim_webhooks(consumer, count, min_idle_time, start_id='0-0'):
+    """
+    Забирает себе записи, которые слишком долго не подтверждены (XAUTOCLAIM).
+
+    Подхватывает и собственные неудачные пачки, и записи потребителей,
+    которые упали или были заменены (например, контейнер с новым hostname).
+
+    Args:
+        consumer: имя потребителя в группе
+        count: максимальное количество записей
+        min_idle_time: минимальное время без подтверждения в миллисекундах
+        start_id: id, с которого продолжить обход списка ожидающих записей
+
+    Returns:
+        tuple: (id для следующего вызова или '0-0', если обход завершен,
+            список пар (id записи, webhook в JSON))
+    """
+    response = get_client().xautoclaim(
+        settings.WEBHOOK_QUEUE_STREAM,
+        settings.WEBHOOK_QUEUE_GROUP,
+        consumer,
+        min_idle_time,
+        start_id=start_id,
+        count=count
+    )
+    next_id, entries = response[0], response[1]
+    if isinstance(next_id, bytes):
+        next_id = next_id.decode()
+    return next_id, [
+        (entry_id, fields[b'payload'])
+        for entry_id, fields in entries
+        if fields
+    ]
+
+
+def ack_webhooks(entry_ids):
+    """Подтверждает обработку записей очереди."""
+    if entry_ids:
+        get_client().xack(
+            settings.WEBHOOK_QUEUE_STREAM,
+            settings.WEBHOOK_QUEUE_GROUP,
+            *entry_ids
+        )
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -59,9 +60,32 @@ DATABASES = {
         'PASSWORD': 'password',
         'HOST': 'localhost',
         'PORT': '3306',
+        # Постоянные соединения: при всплесках webhook-ов запросы не платят
+        # за установку соединения и аутентификацию в MySQL.
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'connect_timeout': int(os.environ.get('DB_CONNECT_TIMEOUT', 2)),
+            # InnoDB по умолчанию работает в REPEATABLE READ и ставит gap-блокировки
+            # на горячем пути начисления баланса; атомарным UPDATE они не нужны.
+            'isolation_level': 'read committed',
+        },
+    }
+}
+
+
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
     }
 }
 
+# Время жизни закэшированного баланса организации в секундах.
+BALANCE_CACHE_TIMEOUT = int(os.environ.get('BALANCE_CACHE_TIMEOUT', 3600))
+
 
 LOGGING = {
     'version': 1,
@@ -84,6 +108,27 @@ LOGGING = {
 }
 
 
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
+# Ключ для проверки HMAC-подписи webhook-ов (заголовок X-Bank-Signature).
+BANK_WEBHOOK_SECRET = os.environ.get('BANK_WEBHOOK_SECRET', '')
+
+# Размер пачки для bulk-операций при пакетной обработке webhook-ов.
+BULK_BATCH_SIZE = int(os.environ.get('BULK_BATCH_SIZE', 1000))
+
+# Асинхронная обработка webhook-ов: эндпоинты кладут платежи в Redis Stream
+# и сразу отвечают 202, а команда process_webhooks обрабатывает их пачками.
+WEBHOOK_QUEUE_ENABLED = os.environ.get(
+    'WEBHOOK_QUEUE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+WEBHOOK_QUEUE_STREAM = os.environ.get('WEBHOOK_QUEUE_STREAM', 'bank_webhooks')
+WEBHOOK_QUEUE_GROUP = os.environ.get('WEBHOOK_QUEUE_GROUP', 'bank_webhooks_workers')
+
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',